@@ -10,8 +10,8 @@ router = APIRouter()
 
 
 @router.post("/api/conversations", response_model=Conversation)
-async def create_conversation(request: CreateConversationRequest):
+def create_conversation(request: CreateConversationRequest):
     """Create a new conversation."""
-    conversation_id = str(uuid.uuid4())
+    conversation_id = uuid.uuid4().hex
     conversation = storage.create_conversation(conversation_id)
     return conversation
@@ -0,0 +1,52 @@
+"""Shared request dependencies for API endpoints."""
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from ..models import SendMessageRequest
+
+# OpenAPI request body for endpoints that parse SendMessageRequest manually
+SEND_MESSAGE_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": SendMessageRequest.model_json_schema()}
+        },
+    }
+}
+
+
+async def parse_send_message_request(request: Request) -> SendMessageRequest:
+    """
+    Parse and validate the raw request body as a SendMessageRequest.
+
+    Validates the body bytes in a single pass with model_validate_json instead
+    of decoding to a dict first and validating that. The body is streamed
+    into one growing buffer, so no second immutable copy is made.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        The validated SendMessageRequest
+
+    Raises:
+        RequestValidationError: If the body is not a valid SendMessageRequest
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+
+    try:
+        return SendMessageRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = []
+        for error in e.errors(include_url=False):
+            error["loc"] = ("body", *error["loc"])
+            if isinstance(error.get("input"), bytearray):
+                # Invalid JSON reports the raw body, which may be huge or not
+                # UTF-8; omit it like FastAPI's own body parsing does
+                error["input"] = {}
+            errors.append(error)
+        raise RequestValidationError(errors)
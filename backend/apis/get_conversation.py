@@ -1,6 +1,6 @@
 """Get conversation endpoint."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from .. import storage
 from ..models import Conversation
@@ -8,11 +8,41 @@ from ..models import Conversation
 router = APIRouter()
 
 
-@router.get("/api/conversations/{conversation_id}", response_model=Conversation)
-async def get_conversation(conversation_id: str):
-    """Get a specific conversation with all its messages."""
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
+def _etag(updated_at: str) -> str:
+    """Build a weak ETag from a conversation's last-modified timestamp."""
+    return f'W/"{updated_at}"'
+
+
+def _cache_headers(etag: str) -> dict:
+    """Headers that let clients cache a conversation but revalidate every time."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+@router.get(
+    "/api/conversations/{conversation_id}",
+    responses={200: {"model": Conversation}, 304: {"description": "Not Modified"}},
+)
+def get_conversation(conversation_id: str, request: Request):
+    """
+    Get a specific conversation with all its messages.
+    Returns 304 if the client's If-None-Match matches the current version.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        updated_at = storage.get_conversation_updated_at(conversation_id)
+        if updated_at is not None:
+            etag = _etag(updated_at)
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=304, headers=_cache_headers(etag))
+
+    result = storage.get_conversation_bytes(conversation_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    return conversation
+
+    conversation, updated_at = result
+    return Response(
+        content=conversation,
+        media_type="application/json",
+        headers=_cache_headers(_etag(updated_at))
+    )
 
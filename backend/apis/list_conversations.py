@@ -2,6 +2,7 @@
 
 from typing import List
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .. import storage
 from ..models import ConversationMetadata
@@ -9,8 +10,11 @@ from ..models import ConversationMetadata
 router = APIRouter()
 
 
-@router.get("/api/conversations", response_model=List[ConversationMetadata])
-async def list_conversations():
+@router.get(
+    "/api/conversations",
+    responses={200: {"model": List[ConversationMetadata]}},
+)
+def list_conversations():
     """List all conversations (metadata only)."""
-    return storage.list_conversations()
+    return ORJSONResponse(storage.list_conversations())
 
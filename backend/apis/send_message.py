@@ -1,22 +1,31 @@
 """Send message endpoint."""
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
 
 from .. import storage
 from ..council import run_full_council, generate_conversation_title
 from ..models import SendMessageRequest
+from .dependencies import SEND_MESSAGE_OPENAPI_EXTRA, parse_send_message_request
 
 router = APIRouter()
 
 
-@router.post("/api/conversations/{conversation_id}/message")
-async def send_message(conversation_id: str, request: SendMessageRequest):
+@router.post(
+    "/api/conversations/{conversation_id}/message",
+    openapi_extra=SEND_MESSAGE_OPENAPI_EXTRA,
+)
+async def send_message(
+    conversation_id: str,
+    request: SendMessageRequest = Depends(parse_send_message_request)
+):
     """
     Send a message and run the 3-stage council process.
     Returns the complete response with all stages.
     """
     # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    # Storage calls block on SQLite, so run them off the event loop
+    conversation = await asyncio.to_thread(storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -24,20 +33,22 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     is_first_message = len(conversation["messages"]) == 0
 
     # Add user message
-    storage.add_user_message(conversation_id, request.content)
+    await asyncio.to_thread(storage.add_user_message, conversation_id, request.content)
 
     # If this is the first message, generate a title
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
+        title = await generate_conversation_title(request.content, request.use_cache)
+        await asyncio.to_thread(storage.update_conversation_title, conversation_id, title)
 
     # Run the 3-stage council process
     stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
-        request.content
+        request.content,
+        request.use_cache
     )
 
     # Add assistant message with all stages
-    storage.add_assistant_message(
+    await asyncio.to_thread(
+        storage.add_assistant_message,
         conversation_id,
         stage1_results,
         stage2_results,
@@ -1,8 +1,9 @@
 """Send message stream endpoint."""
 
-import json
 import asyncio
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
 from .. import storage
@@ -14,18 +15,31 @@ from ..council import (
     calculate_aggregate_rankings
 )
 from ..models import SendMessageRequest
+from .dependencies import SEND_MESSAGE_OPENAPI_EXTRA, parse_send_message_request
 
 router = APIRouter()
 
 
-@router.post("/api/conversations/{conversation_id}/message/stream")
-async def send_message_stream(conversation_id: str, request: SendMessageRequest):
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+@router.post(
+    "/api/conversations/{conversation_id}/message/stream",
+    openapi_extra=SEND_MESSAGE_OPENAPI_EXTRA,
+)
+async def send_message_stream(
+    conversation_id: str,
+    request: SendMessageRequest = Depends(parse_send_message_request)
+):
     """
     Send a message and stream the 3-stage council process.
     Returns Server-Sent Events as each stage completes.
     """
     # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    # Storage calls block on SQLite, so run them off the event loop
+    conversation = await asyncio.to_thread(storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -35,37 +49,38 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     async def event_generator():
         try:
             # Add user message
-            storage.add_user_message(conversation_id, request.content)
+            await asyncio.to_thread(storage.add_user_message, conversation_id, request.content)
 
             # Start title generation in parallel (don't await yet)
             title_task = None
             if is_first_message:
-                title_task = asyncio.create_task(generate_conversation_title(request.content))
+                title_task = asyncio.create_task(generate_conversation_title(request.content, request.use_cache))
 
             # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results = await stage1_collect_responses(request.content)
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
+            yield _sse_event({'type': 'stage1_start'})
+            stage1_results = await stage1_collect_responses(request.content, request.use_cache)
+            yield _sse_event({'type': 'stage1_complete', 'data': stage1_results})
 
             # Stage 2: Collect rankings
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-            stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results)
+            yield _sse_event({'type': 'stage2_start'})
+            stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results, request.use_cache)
             aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})}\n\n"
+            yield _sse_event({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})
 
             # Stage 3: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-            stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results)
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+            yield _sse_event({'type': 'stage3_start'})
+            stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results, request.use_cache)
+            yield _sse_event({'type': 'stage3_complete', 'data': stage3_result})
 
             # Wait for title generation if it was started
             if title_task:
                 title = await title_task
-                storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                await asyncio.to_thread(storage.update_conversation_title, conversation_id, title)
+                yield _sse_event({'type': 'title_complete', 'data': {'title': title}})
 
             # Save complete assistant message
-            storage.add_assistant_message(
+            await asyncio.to_thread(
+                storage.add_assistant_message,
                 conversation_id,
                 stage1_results,
                 stage2_results,
@@ -73,11 +88,11 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             )
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield _sse_event({'type': 'complete'})
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
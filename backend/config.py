@@ -22,5 +22,39 @@ CHAIRMAN_MODEL = "google/gemini-3-pro-preview"
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
-# Data directory for conversation storage
+# Connection pool limits for the shared OpenRouter HTTP client
+OPENROUTER_MAX_CONNECTIONS = 100
+OPENROUTER_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Maximum in-flight OpenRouter requests per worker process
+OPENROUTER_MAX_CONCURRENCY = int(os.getenv("OPENROUTER_MAX_CONCURRENCY", 16))
+
+# Retries for rate-limited (429) and transient 5xx OpenRouter responses
+OPENROUTER_MAX_RETRIES = 3
+OPENROUTER_RETRY_BASE_DELAY = 0.5
+# Longest Retry-After we wait out; a longer one fails the model instead
+OPENROUTER_MAX_RETRY_DELAY = 10.0
+
+# In-process cache of exact-match model responses. Off by default: the
+# council should sample fresh answers, so enable it for iteration/debugging
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+RESPONSE_CACHE_SIZE = 1024
+
+# Semantic cache for Stage 1 answers (requires the "semantic-cache" extra)
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_SIZE = 10_000
+
+# SQLite database for conversation storage
+DATABASE_PATH = "data/conversations.db"
+
+# Legacy JSON conversation directory, imported into the database on first run
 DATA_DIR = "data/conversations"
+
+# Number of uvicorn worker processes (defaults to one per CPU core)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2))
+
+# Maximum log records waiting for the background log thread; extra records
+# are dropped so a burst of failures can't grow memory without bound
+LOG_QUEUE_SIZE = 10_000
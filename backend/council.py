@@ -1,45 +1,50 @@
 """3-stage LLM Council orchestration."""
 
+import re
 from typing import List, Dict, Any, Tuple
 from .openrouter import query_models_parallel, query_model
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
-from .prompts.loader import (
-    STAGE2_RANKING_TEMPLATE,
-    STAGE3_CHAIRMAN_TEMPLATE,
-    TITLE_GENERATION_TEMPLATE
-)
+from .prompts import loader as prompts
 
+# Ranking patterns, compiled once at import
+_NUMBERED_RANKING_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+_RESPONSE_LABEL_RE = re.compile(r'Response [A-Z]')
 
-async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
+
+async def stage1_collect_responses(
+    user_query: str,
+    cache: bool = True
+) -> List[Dict[str, Any]]:
     """
     Stage 1: Collect individual responses from all council models.
 
     Args:
         user_query: The user's question
+        cache: Whether cached model responses may be reused
 
     Returns:
         List of dicts with 'model' and 'response' keys
     """
     messages = [{"role": "user", "content": user_query}]
 
-    # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
-
-    # Format results
-    stage1_results = []
-    for model, response in responses.items():
-        if response is not None:  # Only include successful responses
-            stage1_results.append({
-                "model": model,
-                "response": response.get('content', '')
-            })
+    # Query all models in parallel; Stage 1 answers depend only on the
+    # question, so near-duplicate questions may reuse them
+    responses = await query_models_parallel(
+        COUNCIL_MODELS, messages, cache=cache, semantic_cache=True
+    )
 
-    return stage1_results
+    # Format results, only including successful responses
+    return [
+        {"model": model, "response": response.get('content', '')}
+        for model, response in responses.items()
+        if response is not None
+    ]
 
 
 async def stage2_collect_rankings(
     user_query: str,
-    stage1_results: List[Dict[str, Any]]
+    stage1_results: List[Dict[str, Any]],
+    cache: bool = True
 ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
     """
     Stage 2: Each model ranks the anonymized responses.
@@ -47,26 +52,24 @@ async def stage2_collect_rankings(
     Args:
         user_query: The original user query
         stage1_results: Results from Stage 1
+        cache: Whether cached model responses may be reused
 
     Returns:
         Tuple of (rankings list, label_to_model mapping)
     """
-    # Create anonymized labels for responses (Response A, Response B, etc.)
-    labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
-
-    # Create mapping from label to model name
-    label_to_model = {
-        f"Response {label}": result['model']
-        for label, result in zip(labels, stage1_results)
-    }
+    # Anonymize responses (Response A, Response B, etc.) in a single pass,
+    # building the label to model mapping alongside the prompt sections
+    label_to_model = {}
+    response_sections = []
+    for i, result in enumerate(stage1_results):
+        label = f"Response {chr(65 + i)}"  # A, B, C, ...
+        label_to_model[label] = result['model']
+        response_sections.append(f"{label}:\n{result['response']}")
 
     # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
+    responses_text = "\n\n".join(response_sections)
 
-    ranking_prompt = STAGE2_RANKING_TEMPLATE.format(
+    ranking_prompt = prompts.STAGE2_RANKING_TEMPLATE.format(
         user_query=user_query,
         responses_text=responses_text
     )
@@ -74,7 +77,7 @@ async def stage2_collect_rankings(
     messages = [{"role": "user", "content": ranking_prompt}]
 
     # Get rankings from all council models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
+    responses = await query_models_parallel(COUNCIL_MODELS, messages, cache=cache)
 
     # Format results
     stage2_results = []
@@ -94,7 +97,8 @@ async def stage2_collect_rankings(
 async def stage3_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]]
+    stage2_results: List[Dict[str, Any]],
+    cache: bool = True
 ) -> Dict[str, Any]:
     """
     Stage 3: Chairman synthesizes final response.
@@ -103,6 +107,7 @@ async def stage3_synthesize_final(
         user_query: The original user query
         stage1_results: Individual model responses from Stage 1
         stage2_results: Rankings from Stage 2
+        cache: Whether cached model responses may be reused
 
     Returns:
         Dict with 'model' and 'response' keys
@@ -118,7 +123,7 @@ async def stage3_synthesize_final(
         for result in stage2_results
     ])
 
-    chairman_prompt = STAGE3_CHAIRMAN_TEMPLATE.format(
+    chairman_prompt = prompts.STAGE3_CHAIRMAN_TEMPLATE.format(
         user_query=user_query,
         stage1_text=stage1_text,
         stage2_text=stage2_text
@@ -127,7 +132,7 @@ async def stage3_synthesize_final(
     messages = [{"role": "user", "content": chairman_prompt}]
 
     # Query the chairman model
-    response = await query_model(CHAIRMAN_MODEL, messages)
+    response = await query_model(CHAIRMAN_MODEL, messages, cache=cache)
 
     if response is None:
         # Fallback if chairman fails
@@ -152,8 +157,6 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
     # Look for "FINAL RANKING:" section
     if "FINAL RANKING:" in ranking_text:
         # Extract everything after "FINAL RANKING:"
@@ -161,19 +164,16 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
         if len(parts) >= 2:
             ranking_section = parts[1]
             # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
+            # The capture group yields just the "Response X" part of each match
+            numbered_matches = _NUMBERED_RANKING_RE.findall(ranking_section)
             if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
+                return numbered_matches
 
             # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
+            return _RESPONSE_LABEL_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
+    return _RESPONSE_LABEL_RE.findall(ranking_text)
 
 
 def calculate_aggregate_rankings(
@@ -184,7 +184,7 @@ def calculate_aggregate_rankings(
     Calculate aggregate rankings across all models.
 
     Args:
-        stage2_results: Rankings from each model
+        stage2_results: Rankings from each model, with 'parsed_ranking' lists
         label_to_model: Mapping from anonymous labels to model names
 
     Returns:
@@ -196,14 +196,10 @@ def calculate_aggregate_rankings(
     model_positions = defaultdict(list)
 
     for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
-
-        for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
+        # Reuse the ranking already parsed in Stage 2
+        for position, label in enumerate(ranking['parsed_ranking'], start=1):
+            model_name = label_to_model.get(label)
+            if model_name is not None:
                 model_positions[model_name].append(position)
 
     # Calculate average position for each model
@@ -223,22 +219,25 @@ def calculate_aggregate_rankings(
     return aggregate
 
 
-async def generate_conversation_title(user_query: str) -> str:
+async def generate_conversation_title(user_query: str, cache: bool = True) -> str:
     """
     Generate a short title for a conversation based on the first user message.
 
     Args:
         user_query: The first user message
+        cache: Whether cached model responses may be reused
 
     Returns:
         A short title (3-5 words)
     """
-    title_prompt = TITLE_GENERATION_TEMPLATE.format(user_query=user_query)
+    title_prompt = prompts.TITLE_GENERATION_TEMPLATE.format(user_query=user_query)
 
     messages = [{"role": "user", "content": title_prompt}]
 
     # Use gemini-2.5-flash for title generation (fast and cheap)
-    response = await query_model("google/gemini-2.5-flash", messages, timeout=30.0)
+    response = await query_model(
+        "google/gemini-2.5-flash", messages, timeout=30.0, cache=cache
+    )
 
     if response is None:
         # Fallback to a generic title
@@ -256,18 +255,22 @@ async def generate_conversation_title(user_query: str) -> str:
     return title
 
 
-async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
+async def run_full_council(
+    user_query: str,
+    cache: bool = True
+) -> Tuple[List, List, Dict, Dict]:
     """
     Run the complete 3-stage council process.
 
     Args:
         user_query: The user's question
+        cache: Whether cached model responses may be reused
 
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
     # Stage 1: Collect individual responses
-    stage1_results = await stage1_collect_responses(user_query)
+    stage1_results = await stage1_collect_responses(user_query, cache)
 
     # If no models responded successfully, return error
     if not stage1_results:
@@ -277,7 +280,9 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
         }, {}
 
     # Stage 2: Collect rankings
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
+    stage2_results, label_to_model = await stage2_collect_rankings(
+        user_query, stage1_results, cache
+    )
 
     # Calculate aggregate rankings
     aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
@@ -286,7 +291,8 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
     stage3_result = await stage3_synthesize_final(
         user_query,
         stage1_results,
-        stage2_results
+        stage2_results,
+        cache
     )
 
     # Prepare metadata
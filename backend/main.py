@@ -1,11 +1,73 @@
 """FastAPI backend for LLM Council."""
 
+import asyncio
+import logging
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from . import openrouter
 from .apis import api_router
+from .config import LOG_QUEUE_SIZE, WEB_CONCURRENCY
 
-app = FastAPI(title="LLM Council API")
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that discards records when the log queue is full."""
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def _configure_logging() -> QueueListener:
+    """
+    Route backend log records through a queue.
+
+    Handlers run on the listener's background thread, so formatting and
+    writing to stderr never block the event loop. The queue is bounded and
+    records are dropped rather than waited on when it fills up.
+
+    Returns:
+        The (not yet started) listener draining the queue
+    """
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    backend_logger = logging.getLogger("backend")
+    backend_logger.setLevel(logging.INFO)
+    backend_logger.handlers = [_DroppingQueueHandler(log_queue)]
+    backend_logger.propagate = False
+
+    return QueueListener(log_queue, stream_handler)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the log listener, pre-warm the OpenRouter client and clean up on shutdown."""
+    log_listener = _configure_logging()
+    log_listener.start()
+    warm_up_task = asyncio.create_task(openrouter.warm_up())
+    try:
+        yield
+        warm_up_task.cancel()
+        await openrouter.close_client()
+    finally:
+        log_listener.stop()
+
+
+app = FastAPI(
+    title="LLM Council API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Enable CORS for local development
 app.add_middleware(
@@ -22,4 +84,12 @@ app.include_router(api_router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=WEB_CONCURRENCY,
+        # "auto" picks uvloop where it is installed (not on Windows/PyPy)
+        loop="auto",
+        http="httptools",
+    )
@@ -3,12 +3,22 @@
 from .create_conversation_request import CreateConversationRequest
 from .send_message_request import SendMessageRequest
 from .conversation_metadata import ConversationMetadata
+from .model_response import ModelResponse
+from .model_ranking import ModelRanking
+from .user_message import UserMessage
+from .assistant_message import AssistantMessage
+from .message import Message
 from .conversation import Conversation
 
 __all__ = [
     "CreateConversationRequest",
     "SendMessageRequest",
     "ConversationMetadata",
+    "ModelResponse",
+    "ModelRanking",
+    "UserMessage",
+    "AssistantMessage",
+    "Message",
     "Conversation",
 ]
 
@@ -0,0 +1,17 @@
+"""Model for an assistant message in a conversation."""
+
+from typing import List, Literal
+from pydantic import BaseModel, ConfigDict
+
+from .model_ranking import ModelRanking
+from .model_response import ModelResponse
+
+
+class AssistantMessage(BaseModel):
+    """Council reply with the results of all 3 stages."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    role: Literal["assistant"]
+    stage1: List[ModelResponse]
+    stage2: List[ModelRanking]
+    stage3: ModelResponse
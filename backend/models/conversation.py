@@ -1,13 +1,17 @@
 """Model for full conversation with all messages."""
 
-from typing import List, Dict, Any
-from pydantic import BaseModel
+from typing import List
+from pydantic import BaseModel, ConfigDict
+
+from .message import Message
 
 
 class Conversation(BaseModel):
     """Full conversation with all messages."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     created_at: str
     title: str
-    messages: List[Dict[str, Any]]
+    messages: List[Message]
 
@@ -1,10 +1,12 @@
 """Model for conversation metadata in list view."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ConversationMetadata(BaseModel):
     """Conversation metadata for list view."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     created_at: str
     title: str
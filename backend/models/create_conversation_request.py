@@ -1,9 +1,9 @@
 """Request model for creating a new conversation."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateConversationRequest(BaseModel):
     """Request to create a new conversation."""
-    pass
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
@@ -0,0 +1,9 @@
+"""Conversation message type, discriminated on role."""
+
+from typing import Annotated, Union
+from pydantic import Field
+
+from .assistant_message import AssistantMessage
+from .user_message import UserMessage
+
+Message = Annotated[Union[UserMessage, AssistantMessage], Field(discriminator="role")]
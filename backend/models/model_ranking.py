@@ -0,0 +1,13 @@
+"""Model for a single model's Stage 2 ranking."""
+
+from typing import List
+from pydantic import BaseModel, ConfigDict
+
+
+class ModelRanking(BaseModel):
+    """A council model's evaluation and parsed ranking of the anonymized responses."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    model: str
+    ranking: str
+    parsed_ranking: List[str]
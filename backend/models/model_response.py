@@ -0,0 +1,11 @@
+"""Model for a single model's response in Stage 1 or Stage 3."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ModelResponse(BaseModel):
+    """A council model's answer (Stage 1) or the chairman's synthesis (Stage 3)."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    model: str
+    response: str
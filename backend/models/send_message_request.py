@@ -1,9 +1,13 @@
 """Request model for sending a message in a conversation."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SendMessageRequest(BaseModel):
     """Request to send a message in a conversation."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     content: str
+    # Set to False to force fresh model calls when response caching is enabled
+    use_cache: bool = True
 
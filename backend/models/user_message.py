@@ -0,0 +1,12 @@
+"""Model for a user message in a conversation."""
+
+from typing import Literal
+from pydantic import BaseModel, ConfigDict
+
+
+class UserMessage(BaseModel):
+    """Message sent by the user."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    role: Literal["user"]
+    content: str
@@ -1,14 +1,289 @@
 """OpenRouter API client for making LLM requests."""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import logging
+import random
+from collections import OrderedDict
+from typing import List, Dict, Any, AsyncIterator, Coroutine, Optional, TypeVar
 import httpx
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+import orjson
+from .config import (
+    OPENROUTER_API_KEY,
+    OPENROUTER_API_URL,
+    OPENROUTER_MAX_CONNECTIONS,
+    OPENROUTER_MAX_KEEPALIVE_CONNECTIONS,
+    OPENROUTER_MAX_CONCURRENCY,
+    OPENROUTER_MAX_RETRIES,
+    OPENROUTER_RETRY_BASE_DELAY,
+    OPENROUTER_MAX_RETRY_DELAY,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_SIZE,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_SIZE,
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Shared HTTP/2 client, created lazily so each worker process owns its own
+# pool; concurrent requests multiplex over one connection to OpenRouter
+_client: Optional[httpx.AsyncClient] = None
+
+# Caps in-flight requests so large fan-outs don't trip OpenRouter rate limits
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            timeout=httpx.Timeout(120.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=OPENROUTER_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENROUTER_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the request concurrency limiter, creating it on first use."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(OPENROUTER_MAX_CONCURRENCY)
+    return _semaphore
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on uvloop when it is installed.
+
+    For scripts that use this module directly. The API server picks its
+    loop through uvicorn (loop="auto"), which also prefers uvloop.
+
+    Args:
+        main: Coroutine to run, e.g. query_models_parallel(...)
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
+async def warm_up():
+    """
+    Create the shared client and open a pooled connection to OpenRouter.
+
+    Lets the first council request skip client construction and the TLS
+    handshake. Best effort: failures are logged and otherwise ignored.
+    """
+    try:
+        await _get_client().head(OPENROUTER_API_URL, timeout=10.0)
+    except httpx.HTTPError as e:
+        logger.info("OpenRouter connection warm-up failed: %s", e)
+
+
+async def close_client():
+    """Close the shared HTTP client and release its pooled connections."""
+    global _client, _semaphore
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _semaphore = None
+
+
+def _payload_prefix(model: str) -> bytes:
+    """Encode the start of a chat completion request body for a model."""
+    return b'{"model":' + orjson.dumps(model) + b',"messages":'
+
+
+# Body prefixes for the configured council, built once at import
+_PAYLOAD_PREFIXES: Dict[str, bytes] = {
+    model: _payload_prefix(model)
+    for model in (*COUNCIL_MODELS, CHAIRMAN_MODEL)
+}
+
+
+def _build_payload(model: str, encoded_messages: bytes, stream: bool = False) -> bytes:
+    """Build a chat completion request body around already-encoded messages."""
+    prefix = _PAYLOAD_PREFIXES.get(model) or _payload_prefix(model)
+    suffix = b',"stream":true}' if stream else b'}'
+    return prefix + encoded_messages + suffix
+
+
+# LRU cache of successful responses, keyed by a hash of model + messages
+_response_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_key(model: str, encoded_messages: bytes) -> bytes:
+    """Hash a model identifier and encoded messages into a cache key."""
+    return hashlib.blake2b(
+        model.encode() + b"\0" + encoded_messages,
+        digest_size=16
+    ).digest()
+
+
+# Status codes worth retrying: rate limiting and transient upstream errors
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a failed request.
+
+    Uses the Retry-After header when it gives a number of seconds, otherwise
+    exponential backoff with a little jitter.
+
+    Args:
+        response: The response that failed
+        attempt: Zero-based index of the attempt that failed
+
+    Returns:
+        Delay in seconds, or None if Retry-After asks for longer than
+        OPENROUTER_MAX_RETRY_DELAY and the request should not be retried
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            pass
+        else:
+            if not delay <= OPENROUTER_MAX_RETRY_DELAY:
+                return None
+            return max(delay, 0.0)
+    return OPENROUTER_RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.1
+
+
+# Semantic cache, created on first use when SEMANTIC_CACHE_ENABLED is set;
+# a failed import or model load turns it off for the life of the process
+_semantic_cache = None
+_semantic_cache_unavailable = False
+_semantic_cache_lock: Optional[asyncio.Lock] = None
+
+
+async def _get_semantic_cache():
+    """Get the semantic cache, or None if it is disabled or unavailable."""
+    global _semantic_cache, _semantic_cache_unavailable, _semantic_cache_lock
+    if not SEMANTIC_CACHE_ENABLED or _semantic_cache_unavailable:
+        return None
+    if _semantic_cache is not None:
+        return _semantic_cache
+
+    if _semantic_cache_lock is None:
+        _semantic_cache_lock = asyncio.Lock()
+    async with _semantic_cache_lock:
+        if _semantic_cache is None and not _semantic_cache_unavailable:
+            try:
+                from .semantic_cache import SemanticCache, sentence_transformer_embedder
+                # Imports sentence-transformers and loads the model; slow
+                embed_fn = await asyncio.to_thread(
+                    sentence_transformer_embedder, SEMANTIC_CACHE_MODEL
+                )
+            except Exception as e:
+                logger.warning("Semantic cache disabled: %s", e)
+                _semantic_cache_unavailable = True
+                return None
+
+            _semantic_cache = SemanticCache(
+                embed_fn,
+                threshold=SEMANTIC_CACHE_THRESHOLD,
+                max_entries=SEMANTIC_CACHE_SIZE
+            )
+
+    return _semantic_cache
+
+
+async def _query_encoded(
+    model: str,
+    encoded_messages: bytes,
+    timeout: float = 120.0,
+    cache: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Query a single model with a messages list that is already JSON-encoded.
+
+    Rate-limited and transient 5xx responses are retried with backoff.
+
+    Args:
+        model: OpenRouter model identifier
+        encoded_messages: JSON-encoded list of message dicts
+        timeout: Request timeout in seconds
+        cache: Whether to serve and store the response in the response cache
+            (only when RESPONSE_CACHE_ENABLED)
+
+    Returns:
+        Response dict with 'content' and optional 'reasoning_details'
+
+    Raises:
+        Exception: Any transport, HTTP status or response format error
+    """
+    cache = cache and RESPONSE_CACHE_ENABLED
+    if cache:
+        key = _cache_key(model, encoded_messages)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return dict(cached)
+
+    payload = _build_payload(model, encoded_messages)
+    for attempt in range(OPENROUTER_MAX_RETRIES + 1):
+        async with _get_semaphore():
+            response = await _get_client().post(
+                OPENROUTER_API_URL,
+                content=payload,
+                timeout=timeout
+            )
+        status_code = response.status_code
+        if status_code < 400:
+            break
+        if (status_code not in _RETRY_STATUS_CODES
+                or attempt == OPENROUTER_MAX_RETRIES):
+            response.raise_for_status()
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            response.raise_for_status()
+        # Sleep outside the semaphore so waiting retries don't block others
+        await asyncio.sleep(delay)
+
+    data = orjson.loads(response.content)
+    message = data['choices'][0]['message']
+
+    result = {
+        'content': message.get('content'),
+        'reasoning_details': message.get('reasoning_details')
+    }
+
+    if cache:
+        _response_cache[key] = result
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+        return dict(result)
+
+    return result
 
 
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
-    timeout: float = 120.0
+    timeout: float = 120.0,
+    cache: bool = True
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
@@ -17,63 +292,167 @@ async def query_model(
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
         timeout: Request timeout in seconds
+        cache: Whether to reuse a cached response for identical requests
+            (only when RESPONSE_CACHE_ENABLED)
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    try:
+        return await _query_encoded(model, orjson.dumps(messages), timeout, cache)
+    except Exception as e:
+        logger.warning("Error querying model %s: %s", model, e)
+        return None
 
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0
+) -> AsyncIterator[str]:
+    """
+    Query a single model and yield its reply as it is generated.
 
-            data = response.json()
-            message = data['choices'][0]['message']
+    Streamed replies bypass the response cache and are not retried.
 
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
 
-    except Exception as e:
-        print(f"Error querying model {model}: {e}")
-        return None
+    Yields:
+        Chunks of the reply content, in order
+
+    Raises:
+        Exception: Any transport, HTTP status or response format error
+    """
+    payload = _build_payload(model, orjson.dumps(messages), stream=True)
+
+    async with _get_semaphore():
+        async with _get_client().stream(
+            "POST",
+            OPENROUTER_API_URL,
+            content=payload,
+            timeout=timeout
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                response.raise_for_status()
+
+            # Server-sent events; lines starting with ':' are keep-alive comments
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+
+                chunk = orjson.loads(data)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"].get("message", "stream error"))
+                for choice in chunk.get("choices", ()):
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        yield content
 
 
 async def query_models_parallel(
     models: List[str],
-    messages: List[Dict[str, str]]
+    messages: List[Dict[str, str]],
+    cache: bool = True,
+    semantic_cache: bool = False
 ) -> Dict[str, Optional[Dict[str, Any]]]:
     """
     Query multiple models in parallel.
 
+    The messages are JSON-encoded once and the same bytes are spliced into
+    every model's request body. A model listed more than once is only
+    queried once.
+
     Args:
         models: List of OpenRouter model identifiers
         messages: List of message dicts to send to each model
+        cache: Whether to reuse cached responses at all; identical requests
+            are only matched when RESPONSE_CACHE_ENABLED
+        semantic_cache: Whether to also reuse responses to similar prompts,
+            matched on the last message (only when SEMANTIC_CACHE_ENABLED)
 
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
+    encoded_messages = orjson.dumps(messages)
+
+    # Query each distinct model once; duplicates share its response
+    unique_models = list(dict.fromkeys(models))
+
+    # Serve what we can from the semantic cache
+    results = {}
+    semantic = await _get_semantic_cache() if cache and semantic_cache else None
+    vector = None
+    if semantic is not None:
+        try:
+            vector = await asyncio.to_thread(semantic.embed, messages[-1]['content'])
+        except Exception as e:
+            logger.warning("Semantic cache lookup failed: %s", e)
+    if vector is not None:
+        for model in unique_models:
+            hit = semantic.lookup(model, vector)
+            if hit is not None:
+                results[model] = dict(hit)
+    pending = [model for model in unique_models if model not in results]
+
+    # Create tasks for the remaining models
+    query = _query_encoded
+    tasks = [query(model, encoded_messages, cache=cache) for model in pending]
+
+    # Wait for all to complete, collecting failures instead of raising
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Replace failures with None, then map models to their responses
+    for i, response in enumerate(responses):
+        if isinstance(response, BaseException):
+            logger.warning("Error querying model %s: %s", pending[i], response)
+            responses[i] = None
+        elif vector is not None:
+            semantic.add(pending[i], vector, response)
+    results.update(zip(pending, responses))
+
+    # Keep the caller's model order
+    return {model: results[model] for model in models}
+
+
+async def query_model_batch(
+    model: str,
+    messages_list: List[List[Dict[str, str]]],
+    cache: bool = True
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Query one model with many different conversations.
+
+    Requests are pipelined over the shared client, bounded by the request
+    semaphore, and identical conversations are only sent once.
+
+    Args:
+        model: OpenRouter model identifier
+        messages_list: One messages list per query
+        cache: Whether to reuse cached responses for identical requests
+            (only when RESPONSE_CACHE_ENABLED)
+
+    Returns:
+        Response dicts (or None if failed), in the order of messages_list
+    """
+    encoded_list = [orjson.dumps(messages) for messages in messages_list]
+    unique_encoded = list(dict.fromkeys(encoded_list))
 
-    # Create tasks for all models
-    tasks = [query_model(model, messages) for model in models]
+    responses = await asyncio.gather(
+        *(_query_encoded(model, encoded, cache=cache) for encoded in unique_encoded),
+        return_exceptions=True
+    )
 
-    # Wait for all to complete
-    responses = await asyncio.gather(*tasks)
+    for i, response in enumerate(responses):
+        if isinstance(response, BaseException):
+            logger.warning("Error querying model %s: %s", model, response)
+            responses[i] = None
 
-    # Map models to their responses
-    return {model: response for model, response in zip(models, responses)}
+    results = dict(zip(unique_encoded, responses))
+    return [results[encoded] for encoded in encoded_list]
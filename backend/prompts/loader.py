@@ -1,11 +1,16 @@
 """Load prompt templates from markdown files."""
 
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
 
 
-# Cache loaded prompts
-_loaded_prompts: Dict[str, str] = {}
+# Module attributes resolved lazily to their prompt file
+_TEMPLATE_FILES = {
+    "STAGE2_RANKING_TEMPLATE": "stage2_ranking",
+    "STAGE3_CHAIRMAN_TEMPLATE": "stage3_chairman",
+    "TITLE_GENERATION_TEMPLATE": "title_generation",
+}
 
 
 def _get_prompts_dir() -> Path:
@@ -13,35 +18,36 @@ def _get_prompts_dir() -> Path:
     return Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
     """
     Load a prompt template from a markdown file.
-    
+
+    The file is read through a read-only memory map on first use and the
+    decoded template is cached for the lifetime of the process.
+
     Args:
         name: Name of the prompt file (without .md extension)
-        
+
     Returns:
         The prompt template as a string
-        
+
     Raises:
         FileNotFoundError: If the prompt file doesn't exist
     """
-    if name in _loaded_prompts:
-        return _loaded_prompts[name]
-    
     prompts_dir = _get_prompts_dir()
     prompt_path = prompts_dir / f"{name}.md"
-    
+
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-    
-    content = prompt_path.read_text(encoding="utf-8")
-    _loaded_prompts[name] = content
-    return content
 
+    with open(prompt_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
 
-# Pre-load all prompts at module import time
-STAGE2_RANKING_TEMPLATE = load_prompt("stage2_ranking")
-STAGE3_CHAIRMAN_TEMPLATE = load_prompt("stage3_chairman")
-TITLE_GENERATION_TEMPLATE = load_prompt("title_generation")
 
+def __getattr__(name: str) -> str:
+    """Resolve template constants (e.g. STAGE2_RANKING_TEMPLATE) on first access."""
+    if name in _TEMPLATE_FILES:
+        return load_prompt(_TEMPLATE_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,115 @@
+"""Optional semantic response cache based on sentence embeddings.
+
+Requires the ``semantic-cache`` extra (numpy and sentence-transformers).
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Cache of model responses looked up by prompt similarity.
+
+    Embeddings are L2-normalized and stored as rows of one float32 matrix,
+    so a lookup is a single matrix-vector product. Once the matrix is full
+    the oldest entry is overwritten.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], np.ndarray],
+        threshold: float = 0.92,
+        max_entries: int = 10_000
+    ):
+        """
+        Args:
+            embed_fn: Maps a text to a 1-D embedding vector
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses
+        """
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        self._vectors: Optional[np.ndarray] = None
+        self._model_ids = np.full(max_entries, -1, dtype=np.int32)
+        self._model_index: Dict[str, int] = {}
+        self._responses: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed and L2-normalize a text. CPU-bound; call off the event loop."""
+        vector = np.asarray(self._embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, model: str, vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response from the same model for a similar prompt.
+
+        Args:
+            model: Model identifier the response must come from
+            vector: Normalized embedding of the prompt
+
+        Returns:
+            The cached response dict, or None if nothing is similar enough
+        """
+        model_id = self._model_index.get(model)
+        if model_id is None or self._vectors is None:
+            return None
+
+        scores = self._vectors[:self._size] @ vector
+        scores[self._model_ids[:self._size] != model_id] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._responses[best]
+
+    def add(self, model: str, vector: np.ndarray, response: Dict[str, Any]):
+        """
+        Store a response, evicting the oldest entry if the cache is full.
+
+        Args:
+            model: Model identifier that produced the response
+            vector: Normalized embedding of the prompt
+            response: Response dict to cache
+        """
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next
+        self._vectors[slot] = vector
+        self._model_ids[slot] = self._model_index.setdefault(model, len(self._model_index))
+        self._responses[slot] = response
+
+        self._next = (slot + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+
+def sentence_transformer_embedder(model_name: str) -> Callable[[str], np.ndarray]:
+    """
+    Build an embedding function backed by a sentence-transformers model.
+
+    Imports the library and loads (possibly downloading) the model, so it
+    is slow and should run off the event loop.
+
+    Args:
+        model_name: Hugging Face model name (e.g. "sentence-transformers/all-MiniLM-L6-v2")
+
+    Returns:
+        Function mapping a text to its embedding vector
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+        Exception: If the model cannot be loaded
+    """
+    from sentence_transformers import SentenceTransformer
+    encoder = SentenceTransformer(model_name)
+
+    def embed(text: str) -> np.ndarray:
+        return encoder.encode(text, normalize_embeddings=True)
+
+    return embed
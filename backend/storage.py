@@ -1,21 +1,97 @@
-"""JSON-based storage for conversations."""
+"""SQLite-based storage for conversations."""
 
-import json
-import os
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
-from .config import DATA_DIR
-
-
-def ensure_data_dir():
-    """Ensure the data directory exists."""
-    Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
+import orjson
+from .config import DATA_DIR, DATABASE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    title TEXT NOT NULL,
+    messages_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_conversations_created_at
+    ON conversations (created_at);
+"""
+
+# One connection per worker process, opened lazily and shared by the
+# threadpool threads that serve requests; _lock serializes access to it
+_connection: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _now() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.utcnow().isoformat()
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open the database in WAL mode and make sure the schema exists."""
+    Path(DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(
+        DATABASE_PATH,
+        isolation_level=None,
+        check_same_thread=False
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+
+    _import_json_conversations(connection)
+    return connection
+
+
+def _import_json_conversations(connection: sqlite3.Connection):
+    """
+    Import conversations saved by the old JSON file storage.
 
+    Only runs against an empty database, so it is a one-time migration.
 
-def get_conversation_path(conversation_id: str) -> str:
-    """Get the file path for a conversation."""
-    return os.path.join(DATA_DIR, f"{conversation_id}.json")
+    Args:
+        connection: Open database connection
+    """
+    legacy_dir = Path(DATA_DIR)
+    if not legacy_dir.is_dir():
+        return
+    if connection.execute("SELECT 1 FROM conversations LIMIT 1").fetchone():
+        return
+
+    rows = []
+    for path in legacy_dir.glob("*.json"):
+        data = orjson.loads(path.read_bytes())
+        rows.append((
+            data["id"],
+            data["created_at"],
+            data["created_at"],
+            data.get("title", "New Conversation"),
+            orjson.dumps(data["messages"]).decode()
+        ))
+
+    connection.execute("BEGIN")
+    connection.executemany(
+        "INSERT OR IGNORE INTO conversations "
+        "(id, created_at, updated_at, title, messages_json) VALUES (?, ?, ?, ?, ?)",
+        rows
+    )
+    connection.execute("COMMIT")
+
+
+@contextmanager
+def _db() -> Iterator[sqlite3.Connection]:
+    """Lock and yield this process's database connection."""
+    global _connection
+    with _lock:
+        if _connection is None:
+            _connection = _open_connection()
+        yield _connection
 
 
 def create_conversation(conversation_id: str) -> Dict[str, Any]:
@@ -28,19 +104,20 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
     Returns:
         New conversation dict
     """
-    ensure_data_dir()
-
+    created_at = _now()
     conversation = {
         "id": conversation_id,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": created_at,
         "title": "New Conversation",
         "messages": []
     }
 
-    # Save to file
-    path = get_conversation_path(conversation_id)
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    with _db() as db:
+        db.execute(
+            "INSERT INTO conversations "
+            "(id, created_at, updated_at, title, messages_json) VALUES (?, ?, ?, ?, '[]')",
+            (conversation_id, created_at, created_at, conversation["title"])
+        )
 
     return conversation
 
@@ -55,13 +132,68 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Conversation dict or None if not found
     """
-    path = get_conversation_path(conversation_id)
+    with _db() as db:
+        row = db.execute(
+            "SELECT id, created_at, title, messages_json FROM conversations WHERE id = ?",
+            (conversation_id,)
+        ).fetchone()
+
+    if row is None:
+        return None
+
+    return {
+        "id": row[0],
+        "created_at": row[1],
+        "title": row[2],
+        "messages": orjson.loads(row[3])
+    }
+
+
+def get_conversation_bytes(conversation_id: str) -> Optional[Tuple[bytes, str]]:
+    """
+    Load a conversation as an encoded JSON document.
+
+    The document is assembled by SQLite, so the message history is never
+    decoded into Python objects.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
 
-    if not os.path.exists(path):
+    Returns:
+        Tuple of (UTF-8 JSON bytes, updated_at timestamp), or None if not found
+    """
+    with _db() as db:
+        row = db.execute(
+            "SELECT json_object("
+            "'id', id, 'created_at', created_at, 'title', title, "
+            "'messages', json(messages_json)"
+            "), updated_at FROM conversations WHERE id = ?",
+            (conversation_id,)
+        ).fetchone()
+
+    if row is None:
         return None
 
-    with open(path, 'r') as f:
-        return json.load(f)
+    return row[0].encode("utf-8"), row[1]
+
+
+def get_conversation_updated_at(conversation_id: str) -> Optional[str]:
+    """
+    Get when a conversation was last modified, without loading it.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        The updated_at timestamp, or None if not found
+    """
+    with _db() as db:
+        row = db.execute(
+            "SELECT updated_at FROM conversations WHERE id = ?",
+            (conversation_id,)
+        ).fetchone()
+
+    return row[0] if row is not None else None
 
 
 def save_conversation(conversation: Dict[str, Any]):
@@ -71,11 +203,18 @@ def save_conversation(conversation: Dict[str, Any]):
     Args:
         conversation: Conversation dict to save
     """
-    ensure_data_dir()
-
-    path = get_conversation_path(conversation['id'])
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    with _db() as db:
+        db.execute(
+            "INSERT OR REPLACE INTO conversations "
+            "(id, created_at, updated_at, title, messages_json) VALUES (?, ?, ?, ?, ?)",
+            (
+                conversation["id"],
+                conversation["created_at"],
+                _now(),
+                conversation.get("title", "New Conversation"),
+                orjson.dumps(conversation["messages"]).decode()
+            )
+        )
 
 
 def list_conversations() -> List[Dict[str, Any]]:
@@ -85,26 +224,43 @@ def list_conversations() -> List[Dict[str, Any]]:
     Returns:
         List of conversation metadata dicts
     """
-    ensure_data_dir()
-
-    conversations = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json'):
-            path = os.path.join(DATA_DIR, filename)
-            with open(path, 'r') as f:
-                data = json.load(f)
-                # Return metadata only
-                conversations.append({
-                    "id": data["id"],
-                    "created_at": data["created_at"],
-                    "title": data.get("title", "New Conversation"),
-                    "message_count": len(data["messages"])
-                })
+    with _db() as db:
+        rows = db.execute(
+            "SELECT id, created_at, title, json_array_length(messages_json) "
+            "FROM conversations ORDER BY created_at DESC"
+        ).fetchall()
+
+    return [
+        {
+            "id": row[0],
+            "created_at": row[1],
+            "title": row[2],
+            "message_count": row[3]
+        }
+        for row in rows
+    ]
+
+
+def _append_message(conversation_id: str, message: Dict[str, Any]):
+    """
+    Append a message to a conversation without loading its history.
 
-    # Sort by creation time, newest first
-    conversations.sort(key=lambda x: x["created_at"], reverse=True)
+    Args:
+        conversation_id: Conversation identifier
+        message: Message dict to append
 
-    return conversations
+    Raises:
+        ValueError: If the conversation does not exist
+    """
+    with _db() as db:
+        cursor = db.execute(
+            "UPDATE conversations "
+            "SET messages_json = json_insert(messages_json, '$[#]', json(?)), updated_at = ? "
+            "WHERE id = ?",
+            (orjson.dumps(message).decode(), _now(), conversation_id)
+        )
+        if cursor.rowcount == 0:
+            raise ValueError(f"Conversation {conversation_id} not found")
 
 
 def add_user_message(conversation_id: str, content: str):
@@ -115,17 +271,11 @@ def add_user_message(conversation_id: str, content: str):
         conversation_id: Conversation identifier
         content: User message content
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-
-    conversation["messages"].append({
+    _append_message(conversation_id, {
         "role": "user",
         "content": content
     })
 
-    save_conversation(conversation)
-
 
 def add_assistant_message(
     conversation_id: str,
@@ -142,19 +292,13 @@ def add_assistant_message(
         stage2: List of model rankings
         stage3: Final synthesized response
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-
-    conversation["messages"].append({
+    _append_message(conversation_id, {
         "role": "assistant",
         "stage1": stage1,
         "stage2": stage2,
         "stage3": stage3
     })
 
-    save_conversation(conversation)
-
 
 def update_conversation_title(conversation_id: str, title: str):
     """
@@ -164,9 +308,10 @@ def update_conversation_title(conversation_id: str, title: str):
         conversation_id: Conversation identifier
         title: New title for the conversation
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-
-    conversation["title"] = title
-    save_conversation(conversation)
+    with _db() as db:
+        cursor = db.execute(
+            "UPDATE conversations SET title = ?, updated_at = ? WHERE id = ?",
+            (title, _now(), conversation_id)
+        )
+        if cursor.rowcount == 0:
+            raise ValueError(f"Conversation {conversation_id} not found")